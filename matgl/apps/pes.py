@@ -58,8 +58,12 @@ class Potential(nn.Module, IOMixIn):
         data_mean = data_mean or 0
         data_std = data_std or 1
 
-        self.data_mean = data_mean.clone().detach() if isinstance(data_mean, torch.Tensor) else torch.tensor(data_mean)
-        self.data_std = data_std.clone().detach() if isinstance(data_std, torch.Tensor) else torch.tensor(data_std)
+        self.register_buffer(
+            "data_mean", data_mean.clone().detach() if isinstance(data_mean, torch.Tensor) else torch.tensor(data_mean)
+        )
+        self.register_buffer(
+            "data_std", data_std.clone().detach() if isinstance(data_std, torch.Tensor) else torch.tensor(data_std)
+        )
 
     def forward(
         self, g: dgl.DGLGraph, state_attr: torch.Tensor | None = None, l_g: dgl.DGLGraph | None = None
@@ -81,7 +85,7 @@ class Potential(nn.Module, IOMixIn):
         else:
             total_energies = predictions
             site_wise = None
-        total_energies = self.data_std * total_energies + self.data_mean
+        total_energies = torch.addcmul(self.data_mean, self.data_std, total_energies)
         if self.element_refs is not None:
             property_offset = torch.squeeze(self.element_refs(g))
             total_energies += property_offset
@@ -91,44 +95,45 @@ class Potential(nn.Module, IOMixIn):
         hessian = torch.zeros(1)
 
         if self.calc_forces:
+            # The graph of the derivatives is only needed for training on forces/stresses and for the hessian.
             grads = grad(
                 total_energies,
                 [g.ndata["pos"], g.edata["bond_vec"]],
                 grad_outputs=torch.ones_like(total_energies),
-                create_graph=True,
-                retain_graph=True,
+                create_graph=self.training or self.calc_hessian,
             )
             forces = -grads[0]
 
         if self.calc_hessian:
+            # DGL's sparse message-passing ops do not implement vmap batching rules, so the batched vjp
+            # (is_grads_batched=True) cannot be used here. Each row is a separate vjp over the retained graph.
+            # The Hessian is symmetric, so only the upper triangle of each row is kept and mirrored. The autograd
+            # rows agree with their transposes to floating point round-off, so this only removes that noise.
             r = -grads[0].view(-1)
             s = r.size(0)
             hessian = total_energies.new_zeros((s, s))
             for iatom in range(s):
-                tmp = grad([r[iatom]], g.ndata["pos"], retain_graph=iatom < s)[0]
-                if tmp is not None:
-                    hessian[iatom] = tmp.view(-1)
+                row = grad(r[iatom], g.ndata["pos"], retain_graph=True)[0].view(-1)
+                hessian[iatom, iatom:] = row[iatom:]
+                hessian[iatom:, iatom] = row[iatom:]
 
         if self.calc_stresses:
             f_ij = -grads[1]
-            sts: list = []
-            count_edge = 0
-            count_node = 0
-            for graph_id in range(g.batch_size):
-                num_edges = g.batch_num_edges()[graph_id]
-                num_nodes = 0
-                sts.append(
-                    -160.21766208
-                    * torch.matmul(
-                        g.edata["bond_vec"][count_edge : count_edge + num_edges].T,
-                        f_ij[count_edge : count_edge + num_edges],
-                    )
-                    / g.ndata["volume"][count_node + num_nodes]
+            if g.batch_size == 1:
+                # A single graph (e.g. the ASE calculator) needs no per-graph scatter.
+                stresses = (-160.21766208 / g.ndata["volume"][0]) * (g.edata["bond_vec"].T @ f_ij)
+            else:
+                # Per-edge outer products bond_vec x f_ij are summed into their graph with a single scatter.
+                batch_num_edges = g.batch_num_edges()
+                batch_num_nodes = g.batch_num_nodes()
+                edge_graph_id = torch.repeat_interleave(
+                    torch.arange(g.batch_size, device=batch_num_edges.device), batch_num_edges
                 )
-                count_edge = count_edge + num_edges
-                num_nodes = g.batch_num_nodes()[graph_id]
-                count_node = count_node + num_nodes
-            stresses = torch.cat(sts)
+                # The eV/A^3 -> GPa conversion is folded into the per-graph volume factor.
+                scale = -160.21766208 / g.ndata["volume"][torch.cumsum(batch_num_nodes, dim=0) - batch_num_nodes]
+                virials = f_ij.new_zeros((g.batch_size, 3, 3))
+                virials.index_add_(0, edge_graph_id, g.edata["bond_vec"][:, :, None] * f_ij[:, None, :])
+                stresses = (virials * scale[:, None, None]).view(-1, 3)
 
         if self.calc_site_wise:
             return total_energies, forces, stresses, hessian, site_wise
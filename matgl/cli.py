@@ -72,6 +72,11 @@ def predict_structure(args):
         args: Args from CLI.
     """
     model = matgl.load_model(args.model)
+
+    def fmt_prediction(val):
+        # Models return one value per target, e.g., a tensor of shape (1,) for a single target.
+        return val.item() if val.numel() == 1 else val.tolist()
+
     if args.infile:
         if args.model == "MEGNet-MP-2019.4.1-BandGap-mfi":
             state_dict = ["PBE", "GLLB-SC", "HSE", "SCAN"]
@@ -79,18 +84,18 @@ def predict_structure(args):
                 s = args.state_attr[count]  # Get the corresponding state attribute
                 structure = Structure.from_file(f)
                 val = model.predict_structure(structure, torch.tensor(int(s)))
-                print(f"{args.model} prediction for {f} with {state_dict[int(s)]} bandgap: {val} eV.")
+                print(f"{args.model} prediction for {f} with {state_dict[int(s)]} bandgap: {fmt_prediction(val)} eV.")
 
         else:
             for f in args.infile:
                 structure = Structure.from_file(f)
                 val = model.predict_structure(structure)
-                print(f"{args.model} prediction for {f}: {val} eV/atom.")
+                print(f"{args.model} prediction for {f}: {fmt_prediction(val)} eV/atom.")
     if args.mpids:
         mpr = MPRester()
         for mid in args.mpids:
             structure = mpr.get_structure_by_material_id(mid)
-            val = model.predict_structure(structure)
+            val = fmt_prediction(model.predict_structure(structure))
             print(f"{args.model} prediction for {mid} ({structure.composition.reduced_formula}): {val}.")
 
 
@@ -11,9 +11,9 @@ from enum import Enum
 from typing import TYPE_CHECKING, Literal
 
 import ase.optimize as opt
+import dgl
 import numpy as np
 import pandas as pd
-import scipy.sparse as sp
 import torch
 from ase import Atoms, units
 from ase.calculators.calculator import Calculator, all_changes
@@ -26,12 +26,12 @@ from ase.md.nvtberendsen import NVTBerendsen
 from pymatgen.core.structure import Molecule, Structure
 from pymatgen.io.ase import AseAtomsAdaptor
 from pymatgen.optimization.neighbors import find_points_in_spheres
+from scipy.spatial import cKDTree
 
 import matgl
 from matgl.graph.converters import GraphConverter
 
 if TYPE_CHECKING:
-    import dgl
     from ase.io import Trajectory
     from ase.optimize.optimize import Optimizer
 
@@ -96,22 +96,23 @@ class Atoms2Graph(GraphConverter):
             )
             exclude_self = (src_id != dst_id) | (bond_dist > numerical_tol)
             src_id, dst_id, images, bond_dist = (
-                src_id[exclude_self],
-                dst_id[exclude_self],
-                images[exclude_self],
-                bond_dist[exclude_self],
+                np.compress(exclude_self, src_id),
+                np.compress(exclude_self, dst_id),
+                np.compress(exclude_self, images, axis=0),
+                np.compress(exclude_self, bond_dist),
             )
         else:
-            dist = np.linalg.norm(cart_coords[:, None, :] - cart_coords[None, :, :], axis=-1)
-            adj = sp.csr_matrix(dist <= self.cutoff) - sp.eye(len(atoms.get_positions()), dtype=np.bool_)
-            adj = adj.tocoo()
-            src_id = adj.row
-            dst_id = adj.col
+            pairs = cKDTree(cart_coords).query_pairs(self.cutoff, output_type="ndarray")
+            src_id = np.concatenate([pairs[:, 0], pairs[:, 1]])
+            dst_id = np.concatenate([pairs[:, 1], pairs[:, 0]])
+            # Bonds must be grouped by source atom for the three-body indices.
+            order = np.lexsort((dst_id, src_id))
+            src_id, dst_id = src_id[order], dst_id[order]
         g, state_attr = super().get_graph_from_processed_structure(
             atoms,
             src_id,
             dst_id,
-            images if atoms.pbc.all() else np.zeros((len(adj.row), 3)),
+            images if atoms.pbc.all() else np.zeros((len(src_id), 3)),
             [lattice_matrix] if atoms.pbc.all() else lattice_matrix,
             element_types,
             cart_coords,
@@ -131,6 +132,7 @@ class M3GNetCalculator(Calculator):
         potential: Potential,
         state_attr: torch.Tensor | None = None,
         stress_weight: float = 1.0,
+        skin: float = 0.0,
         **kwargs,
     ):
         """
@@ -141,6 +143,9 @@ class M3GNetCalculator(Calculator):
             state_attr (tensor): State attribute
             compute_stress (bool): whether to calculate the stress
             stress_weight (float): the stress weight.
+            skin (float): Verlet skin distance in Angstrom. If positive, neighbors are searched within cutoff + skin
+                and the resulting graph is reused until an atom has moved by more than skin / 2 since the last
+                search. Defaults to 0, i.e., the graph is rebuilt for every calculation.
             **kwargs: Kwargs pass through to super().__init__().
         """
         super().__init__(**kwargs)
@@ -151,6 +156,9 @@ class M3GNetCalculator(Calculator):
         self.state_attr = state_attr
         self.element_types = potential.model.element_types  # type: ignore
         self.cutoff = potential.model.cutoff
+        self.skin = skin
+        self.graph_converter = Atoms2Graph(self.element_types, self.cutoff + skin)  # type: ignore
+        self._neighbor_cache: tuple[np.ndarray, dgl.DGLGraph, list] | None = None
 
     def calculate(
         self,
@@ -171,14 +179,24 @@ class M3GNetCalculator(Calculator):
         properties = properties or ["energy"]
         system_changes = system_changes or all_changes
         super().calculate(atoms=atoms, properties=properties, system_changes=system_changes)
-        graph, state_attr_default = Atoms2Graph(self.element_types, self.cutoff).get_graph(atoms)  # type: ignore
-        if self.state_attr is not None:
-            energies, forces, stresses, hessians = self.potential(graph, self.state_attr)
-        else:
-            energies, forces, stresses, hessians = self.potential(graph, state_attr_default)
+        graph, state_attr_default = self._get_graph(atoms, system_changes)  # type: ignore
+        state_attr = self.state_attr if self.state_attr is not None else state_attr_default
+        # Energy-only evaluations need no autograd bookkeeping at all.
+        calc_derivatives = self.potential.calc_forces or self.potential.calc_stresses or self.potential.calc_hessian
+        # Inference only, so the potential runs in eval mode and does not keep the graph of its derivatives. The
+        # caller's mode is restored afterwards, as the same potential may be shared with training code.
+        training = self.potential.training
+        self.potential.eval()
+        try:
+            with contextlib.nullcontext() if calc_derivatives else torch.inference_mode():
+                energies, forces, stresses, hessians = self.potential(graph, state_attr)
+        finally:
+            self.potential.train(training)
+        # The graph holds a single structure, so its energy is the only entry.
+        energy = energies.detach().cpu().numpy()[0]
         self.results.update(
-            energy=energies.detach().cpu().numpy(),
-            free_energy=energies.detach().cpu().numpy(),
+            energy=energy,
+            free_energy=energy,
             forces=forces.detach().cpu().numpy(),
         )
         if self.compute_stress:
@@ -186,6 +204,35 @@ class M3GNetCalculator(Calculator):
         if self.compute_hessian:
             self.results.update(hessian=hessians.detach().cpu().numpy())
 
+    def _get_graph(self, atoms: Atoms, system_changes: list) -> tuple[dgl.DGLGraph, list]:
+        """Get the graph for the current Atoms, reusing the last neighbor search when the skin allows it.
+
+        Args:
+            atoms (ase.Atoms): ase Atoms object
+            system_changes (list): properties of atoms changed since the last calculation.
+
+        Returns:
+            g: DGL graph
+            state_attr: state features
+        """
+        if self.skin <= 0:
+            return self.graph_converter.get_graph(atoms)
+        positions = atoms.get_positions()
+        if (
+            self._neighbor_cache is None
+            or any(change in system_changes for change in ("numbers", "cell", "pbc"))
+            or np.linalg.norm(positions - self._neighbor_cache[0], axis=1).max() > self.skin / 2
+        ):
+            graph, state_attr = self.graph_converter.get_graph(atoms)
+            self._neighbor_cache = (positions, graph, state_attr)
+        _, graph, state_attr = self._neighbor_cache
+        # Only bonds within the model cutoff enter the graph passed to the potential.
+        graph.ndata["pos"] = torch.tensor(positions, dtype=torch.float64)
+        src_id, dst_id = graph.edges()
+        bond_vec = graph.ndata["pos"][dst_id] + graph.edata["pbc_offshift"] - graph.ndata["pos"][src_id]
+        in_cutoff = torch.linalg.norm(bond_vec, dim=1) <= self.cutoff
+        return dgl.edge_subgraph(graph, in_cutoff, relabel_nodes=False, store_ids=False), state_attr
+
 
 class Relaxer:
     """Relaxer is a class for structural relaxation."""
@@ -197,6 +244,7 @@ class Relaxer:
         optimizer: Optimizer | str = "FIRE",
         relax_cell: bool = True,
         stress_weight: float = 0.01,
+        skin: float = 0.0,
     ):
         """
         Args:
@@ -207,10 +255,15 @@ class Relaxer:
             Defaults to "FIRE"
             relax_cell (bool): whether to relax the lattice cell
             stress_weight (float): the stress weight for relaxation.
+            skin (float): Verlet skin distance in Angstrom for reusing the neighbor list between steps, see
+                M3GNetCalculator. Defaults to 0, i.e., the graph is rebuilt for every step.
         """
         self.optimizer: Optimizer = OPTIMIZERS[optimizer.lower()].value if isinstance(optimizer, str) else optimizer
         self.calculator = M3GNetCalculator(
-            potential=potential, state_attr=state_attr, stress_weight=stress_weight  # type: ignore
+            potential=potential,  # type: ignore
+            state_attr=state_attr,
+            stress_weight=stress_weight,
+            skin=skin,
         )
         self.relax_cell = relax_cell
         self.potential = potential
@@ -244,7 +297,7 @@ class Relaxer:
         atoms.set_calculator(self.calculator)
         stream = sys.stdout if verbose else io.StringIO()
         with contextlib.redirect_stdout(stream):
-            obs = TrajectoryObserver(atoms)
+            obs = TrajectoryObserver(atoms, max_steps=steps // interval + 2)
             if self.relax_cell:
                 atoms = ExpCellFilter(atoms)
             optimizer = self.optimizer(atoms, **kwargs)
@@ -267,43 +320,91 @@ class TrajectoryObserver(collections.abc.Sequence):
     intermediate structures.
     """
 
-    def __init__(self, atoms: Atoms) -> None:
+    def __init__(self, atoms: Atoms, max_steps: int | None = None) -> None:
         """
         Init the Trajectory Observer from a Atoms.
 
         Args:
             atoms (Atoms): Structure to observe.
+            max_steps (int): Expected number of observations, used to preallocate the trajectory buffers. The
+                buffers grow as needed if more steps are observed.
         """
         self.atoms = atoms
-        self.energies: list[float] = []
-        self.forces: list[np.ndarray] = []
-        self.stresses: list[np.ndarray] = []
-        self.atom_positions: list[np.ndarray] = []
-        self.cells: list[np.ndarray] = []
+        self._nsteps = 0
+        self._reserve(max_steps or 16)
+
+    def _reserve(self, capacity: int) -> None:
+        """Reallocate the trajectory buffers to hold capacity steps, keeping the steps observed so far.
+
+        Args:
+            capacity (int): Number of steps the buffers can hold.
+        """
+        natoms = len(self.atoms)
+        shapes = {
+            "_energies": (),
+            "_forces": (natoms, 3),
+            "_stresses": (6,),
+            "_atom_positions": (natoms, 3),
+            "_cells": (3, 3),
+        }
+        for name, shape in shapes.items():
+            buffer = np.empty((capacity, *shape))
+            if self._nsteps > 0:
+                buffer[: self._nsteps] = getattr(self, name)[: self._nsteps]
+            setattr(self, name, buffer)
 
     def __call__(self) -> None:
         """The logic for saving the properties of an Atoms during the relaxation."""
-        self.energies.append(float(self.atoms.get_potential_energy()))
-        self.forces.append(self.atoms.get_forces())
-        self.stresses.append(self.atoms.get_stress())
-        self.atom_positions.append(self.atoms.get_positions())
-        self.cells.append(self.atoms.get_cell()[:])
+        if self._nsteps == len(self._energies):
+            self._reserve(2 * self._nsteps)
+        i = self._nsteps
+        self._energies[i] = float(self.atoms.get_potential_energy())
+        self._forces[i] = self.atoms.get_forces()
+        self._stresses[i] = self.atoms.get_stress()
+        self._atom_positions[i] = self.atoms.get_positions()
+        self._cells[i] = self.atoms.get_cell()[:]
+        self._nsteps += 1
+
+    @property
+    def energies(self) -> np.ndarray:
+        """Energies of the observed steps."""
+        return self._energies[: self._nsteps]
+
+    @property
+    def forces(self) -> np.ndarray:
+        """Forces of the observed steps."""
+        return self._forces[: self._nsteps]
+
+    @property
+    def stresses(self) -> np.ndarray:
+        """Stresses of the observed steps."""
+        return self._stresses[: self._nsteps]
+
+    @property
+    def atom_positions(self) -> np.ndarray:
+        """Atom positions of the observed steps."""
+        return self._atom_positions[: self._nsteps]
+
+    @property
+    def cells(self) -> np.ndarray:
+        """Cells of the observed steps."""
+        return self._cells[: self._nsteps]
 
     def __getitem__(self, item):
         return self.energies[item], self.forces[item], self.stresses[item], self.cells[item], self.atom_positions[item]
 
     def __len__(self):
-        return len(self.energies)
+        return self._nsteps
 
     def as_pandas(self) -> pd.DataFrame:
         """Returns: DataFrame of energies, forces, streeses, cells and atom_positions."""
         return pd.DataFrame(
             {
                 "energies": self.energies,
-                "forces": self.forces,
-                "stresses": self.stresses,
-                "cells": self.cells,
-                "atom_positions": self.atom_positions,
+                "forces": list(self.forces),
+                "stresses": list(self.stresses),
+                "cells": list(self.cells),
+                "atom_positions": list(self.atom_positions),
             }
         )
 
@@ -350,6 +451,7 @@ class MolecularDynamics:
         loginterval: int = 1,
         append_trajectory: bool = False,
         mask: tuple | np.ndarray | None = None,
+        skin: float = 0.0,
     ):
         """
         Init the MD simulation.
@@ -379,11 +481,13 @@ class MolecularDynamics:
             append_trajectory (bool): Whether to append to prev trajectory.
             mask (np.array): either a tuple of 3 numbers (0 or 1) or a symmetric 3x3 array indicating,
                              which strain values may change for NPT simulations.
+            skin (float): Verlet skin distance in Angstrom for reusing the neighbor list between steps, see
+                M3GNetCalculator. Defaults to 0, i.e., the graph is rebuilt for every step.
         """
         if isinstance(atoms, (Structure, Molecule)):
             atoms = AseAtomsAdaptor().get_atoms(atoms)
         self.atoms = atoms
-        self.atoms.set_calculator(M3GNetCalculator(potential=potential, state_attr=state_attr))
+        self.atoms.set_calculator(M3GNetCalculator(potential=potential, state_attr=state_attr, skin=skin))
 
         if taut is None:
             taut = 100 * timestep * units.fs
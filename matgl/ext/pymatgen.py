@@ -117,10 +117,10 @@ class Structure2Graph(GraphConverter):
         )
         exclude_self = (src_id != dst_id) | (bond_dist > numerical_tol)
         src_id, dst_id, images, bond_dist = (
-            src_id[exclude_self],
-            dst_id[exclude_self],
-            images[exclude_self],
-            bond_dist[exclude_self],
+            np.compress(exclude_self, src_id),
+            np.compress(exclude_self, dst_id),
+            np.compress(exclude_self, images, axis=0),
+            np.compress(exclude_self, bond_dist),
         )
         g, state_attr = super().get_graph_from_processed_structure(
             structure,
@@ -56,9 +56,9 @@ def compute_3body(g: dgl.DGLGraph):
     src_id = torch.tensor(triple_bond_indices[:, 0], dtype=matgl.int_th)
     dst_id = torch.tensor(triple_bond_indices[:, 1], dtype=matgl.int_th)
     l_g = dgl.graph((src_id, dst_id))
-    three_body_id = torch.concatenate(l_g.edges())
     n_triple_ij = torch.tensor(n_triple_ij, dtype=matgl.int_th)
-    max_three_body_id = torch.max(three_body_id) + 1 if three_body_id.numel() > 0 else 0
+    # DGL infers the number of nodes from the largest referenced bond index.
+    max_three_body_id = l_g.num_nodes()
     l_g.ndata["bond_dist"] = g.edata["bond_dist"][:max_three_body_id]
     l_g.ndata["bond_vec"] = g.edata["bond_vec"][:max_three_body_id]
     l_g.ndata["pbc_offset"] = g.edata["pbc_offset"][:max_three_body_id]
@@ -77,10 +77,11 @@ def compute_pair_vector_and_distance(g: dgl.DGLGraph):
     bond_vec (torch.tensor): bond distance between two atoms
     bond_dist (torch.tensor): vector from src node to dst node
     """
-    dst_pos = g.ndata["pos"][g.edges()[1]] + g.edata["pbc_offshift"]
-    src_pos = g.ndata["pos"][g.edges()[0]]
-    bond_vec = (dst_pos - src_pos).float()
-    bond_dist = torch.norm(bond_vec, dim=1)
+    src_id, dst_id = g.edges()
+    # The shifted destination positions are a fresh tensor, so the source positions are subtracted in place to save
+    # an edge-sized temporary. The order of operations is kept to get bit-identical bond vectors.
+    bond_vec = (g.ndata["pos"][dst_id] + g.edata["pbc_offshift"]).sub_(g.ndata["pos"][src_id]).float()
+    bond_dist = torch.linalg.vector_norm(bond_vec, dim=1)
 
     return bond_vec, bond_dist
 
@@ -2,14 +2,32 @@
 from __future__ import annotations
 
 import abc
+import functools
 
 import dgl
 import numpy as np
 import torch
+from pymatgen.core import Element
 
 import matgl
 
 
+@functools.lru_cache
+def _get_atomic_number_lookup(element_types: tuple[str, ...]) -> np.ndarray:
+    """Get a lookup table mapping atomic numbers to indices in element_types.
+
+    Args:
+        element_types: Element symbols used for graph conversion.
+
+    Returns:
+        Integer array indexed by atomic number. Elements absent from element_types map to -1.
+    """
+    lookup = np.full(max(el.Z for el in Element) + 1, -1, dtype=np.int64)
+    lookup[[Element(el).Z for el in element_types]] = np.arange(len(element_types))
+    lookup.flags.writeable = False
+    return lookup
+
+
 class GraphConverter(metaclass=abc.ABCMeta):
     """Abstract base class for converters from input crystals/molecules to graphs."""
 
@@ -22,6 +40,18 @@ class GraphConverter(metaclass=abc.ABCMeta):
         DGLGraph object, state_attr
         """
 
+    def get_graphs(self, structures) -> tuple[dgl.DGLGraph, np.ndarray]:
+        """Get a single batched DGL graph from several structures.
+
+        Args:
+            structures: Sequence of input crystals or molecules.
+
+        Returns:
+            Batched DGLGraph object, state_attr stacked along the first dimension
+        """
+        graphs, state_attrs = zip(*(self.get_graph(structure) for structure in structures))
+        return dgl.batch(graphs), np.stack(state_attrs)
+
     def get_graph_from_processed_structure(
         self,
         structure,
@@ -49,20 +79,25 @@ class GraphConverter(metaclass=abc.ABCMeta):
             DGLGraph object, state_attr
 
         """
-        u, v = torch.tensor(src_id), torch.tensor(dst_id)
+        u, v = torch.as_tensor(src_id), torch.as_tensor(dst_id)
         g = dgl.graph((u, v), num_nodes=len(structure))
-        pbc_offset = torch.tensor(images, dtype=torch.float64)
+        # Images from the neighbor search are already float64, so this is a zero-copy view for the matmul below.
+        pbc_offset = torch.as_tensor(images, dtype=torch.float64)
         g.edata["pbc_offset"] = pbc_offset.to(matgl.int_th)
-        # Note: pbc_ offshift and pos needs to be float64 to handle cases where bonds are exactly at cutoff
-        g.edata["pbc_offshift"] = torch.matmul(pbc_offset, torch.tensor(lattice_matrix[0]))
-        g.edata["lattice"] = torch.tensor(np.repeat(lattice_matrix, g.num_edges(), axis=0), dtype=matgl.float_th)
-        element_to_index = {elem: idx for idx, elem in enumerate(element_types)}
-        node_type = (
-            np.array([element_types.index(site.specie.symbol) for site in structure])
-            if is_atoms is False
-            else np.array([element_to_index[elem] for elem in structure.get_chemical_symbols()])
-        )
-        g.ndata["node_type"] = torch.tensor(node_type, dtype=matgl.int_th)
-        g.ndata["pos"] = torch.tensor(cart_coords, dtype=torch.float64)
+        # Note: pbc_ offshift and pos needs to be float64 to handle cases where bonds are exactly at cutoff. Rounding
+        # the offshift to float32 makes symmetry-equivalent bonds with different images fall on either side of it.
+        g.edata["pbc_offshift"] = torch.matmul(pbc_offset, torch.tensor(lattice_matrix[0], dtype=torch.float64))
+        # The lattice is shared by all edges, so it is broadcast as a zero-copy view instead of being repeated. Every
+        # edge aliases the same 3x3 storage, so the tensor must be treated as read-only: an in-place write to one edge
+        # changes all of them. Call .contiguous() on it first if per-edge lattices need to be modified.
+        g.edata["lattice"] = torch.tensor(lattice_matrix[0], dtype=matgl.float_th).expand(g.num_edges(), 3, 3)
+        atomic_numbers = np.asarray(structure.numbers if is_atoms else structure.atomic_numbers)
+        node_type = _get_atomic_number_lookup(tuple(element_types))[atomic_numbers]
+        if np.any(node_type < 0):
+            symbols = structure.get_chemical_symbols() if is_atoms else [site.specie.symbol for site in structure]
+            missing = sorted(set(np.array(symbols)[node_type < 0]))
+            raise KeyError(f"Elements {missing} are not in element_types.")
+        g.ndata["node_type"] = torch.as_tensor(node_type, dtype=matgl.int_th)
+        g.ndata["pos"] = torch.as_tensor(cart_coords, dtype=torch.float64)
         state_attr = np.array([0.0, 0.0]).astype(matgl.float_np)
         return g, state_attr
@@ -57,8 +57,27 @@ class GaussianExpansion(nn.Module):
         return torch.exp(-self.width * (diff**2))
 
 
+def _spherical_jn(x: torch.Tensor, max_l: int) -> list[torch.Tensor]:
+    """Spherical Bessel functions of the first kind j_0(x), ..., j_max_l(x) from the upward recurrence
+    j_{l+1}(x) = (2l + 1) / x * j_l(x) - j_{l-1}(x).
+
+    Args:
+        x: torch.Tensor, arguments of any shape.
+        max_l: int, highest order.
+
+    Returns: list of max_l + 1 tensors with the shape of x
+    """
+    sin_x, cos_x = torch.sin(x), torch.cos(x)
+    j = [sin_x / x]
+    if max_l > 0:
+        j.append(sin_x / x**2 - cos_x / x)
+    for i in range(1, max_l):
+        j.append((2 * i + 1) / x * j[i] - j[i - 1])
+    return j
+
+
 class SphericalBesselFunction(nn.Module):
-    """Calculate the spherical Bessel function based on sympy + pytorch implementations."""
+    """Calculate the spherical Bessel function with a pytorch recurrence, or sympy functions when smooth."""
 
     def __init__(self, max_l: int, max_n: int = 5, cutoff: float = 5.0, smooth: bool = False):
         """Args:
@@ -75,19 +94,13 @@ class SphericalBesselFunction(nn.Module):
         if smooth:
             self.funcs = self._calculate_smooth_symbolic_funcs()
         else:
-            self.funcs = self._calculate_symbolic_funcs()
-
-    @lru_cache(maxsize=128)
-    def _calculate_symbolic_funcs(self) -> list:
-        """Spherical basis functions based on Rayleigh formula. This function
-        generates
-        symbolic formula.
-
-        Returns: list of symbolic functions
-        """
-        x = sympy.symbols("x")
-        funcs = [sympy.expand_func(sympy.functions.special.bessel.jn(i, x)) for i in range(self.max_l + 1)]
-        return [sympy.lambdify(x, func, torch) for func in funcs]
+            # The roots and normalization factors only depend on max_l, max_n and cutoff, so they are computed once.
+            # They are non-persistent buffers so that they follow the module across devices without entering the
+            # state dict.
+            roots = SPHERICAL_BESSEL_ROOTS[:max_l, :max_n].clone()
+            j_next = torch.stack([_spherical_jn(roots, max_l)[i + 1][i] for i in range(max_l)])
+            self.register_buffer("roots", roots, persistent=False)
+            self.register_buffer("normalizer", sqrt(2.0 / cutoff**3) / torch.abs(j_next), persistent=False)
 
     @lru_cache(maxsize=128)
     def _calculate_smooth_symbolic_funcs(self) -> list:
@@ -111,18 +124,11 @@ class SphericalBesselFunction(nn.Module):
     def _call_sbf(self, r):
         r_c = r.clone()
         r_c[r_c > self.cutoff] = self.cutoff
-        roots = SPHERICAL_BESSEL_ROOTS[: self.max_l, : self.max_n]
-
-        results = []
-        factor = torch.tensor(sqrt(2.0 / self.cutoff**3))
-        for i in range(self.max_l):
-            root = roots[i]
-            func = self.funcs[i]
-            func_add1 = self.funcs[i + 1]
-            results.append(
-                func(r_c[:, None] * root[None, :] / self.cutoff) * factor / torch.abs(func_add1(root[None, :]))
-            )
-        return torch.cat(results, axis=1)
+        # Each order l is evaluated at its own roots, i.e. row l of x.
+        x = r_c[:, None, None] * self.roots[None, :, :] / self.cutoff
+        j = _spherical_jn(x, self.max_l - 1)
+        results = torch.stack([j[i][:, i] for i in range(self.max_l)], dim=1) * self.normalizer
+        return results.reshape(-1, self.max_l * self.max_n)
 
     @staticmethod
     def rbf_j0(r, cutoff: float = 5.0, max_n: int = 3):
@@ -35,7 +35,7 @@ class ThreeBodyInteractions(nn.Module):
         graph: dgl.DGLGraph,
         line_graph: dgl.DGLGraph,
         three_basis: torch.Tensor,
-        three_cutoff: float,
+        three_cutoff: torch.Tensor | None,
         node_feat: torch.Tensor,
         edge_feat: torch.Tensor,
     ):
@@ -46,19 +46,18 @@ class ThreeBodyInteractions(nn.Module):
             graph: dgl graph
             line_graph: line graph.
             three_basis: three body basis expansion
-            three_cutoff: cutoff radius
+            three_cutoff: cutoff function values of the bonds, or None if three_basis was already weighted by them
+                with weight_three_body_basis, e.g. to share that work between several interaction blocks.
             node_feat: node features
             edge_feat: edge features.
         """
+        if three_cutoff is not None:
+            three_basis = weight_three_body_basis(line_graph, three_basis, three_cutoff)
         end_atom_index = torch.gather(graph.edges()[1], 0, line_graph.edges()[1].to(torch.int64))
         atoms = self.update_network_atom(node_feat)
         end_atom_index = torch.unsqueeze(end_atom_index, 1)
         atoms = torch.squeeze(atoms[end_atom_index])
         basis = three_basis * atoms
-        three_cutoff = torch.unsqueeze(three_cutoff, dim=1)  # type: ignore
-        weights = three_cutoff[torch.stack(list(line_graph.edges()), dim=1)].view(-1, 2)  # type: ignore
-        weights = torch.prod(weights, dim=-1)  # type: ignore
-        basis = basis * weights[:, None]
         new_bonds = scatter_sum(
             basis.to(matgl.float_th),
             segment_ids=get_segment_indices_from_n(line_graph.ndata["n_triple_ij"]),
@@ -71,6 +70,24 @@ class ThreeBodyInteractions(nn.Module):
         return edge_feat_updated
 
 
+def weight_three_body_basis(
+    line_graph: dgl.DGLGraph, three_basis: torch.Tensor, three_cutoff: torch.Tensor
+) -> torch.Tensor:
+    """Weight the three-body basis of each triple by the cutoff function values of its two bonds.
+
+    Args:
+        line_graph: line graph.
+        three_basis: three body basis expansion
+        three_cutoff: cutoff function values of the bonds
+
+    Returns:
+        torch.Tensor: weighted three body basis
+    """
+    weights = three_cutoff[torch.stack(list(line_graph.edges()), dim=1)].view(-1, 2)
+    weights = torch.prod(weights, dim=-1)
+    return three_basis * weights[:, None]
+
+
 def combine_sbf_shf(sbf, shf, max_n: int, max_l: int, use_phi: bool):
     """Combine the spherical Bessel function and the spherical Harmonics function.
 
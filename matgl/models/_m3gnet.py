@@ -10,6 +10,7 @@ please refer to::
 """
 from __future__ import annotations
 
+import contextlib
 import logging
 from typing import TYPE_CHECKING, Literal
 
@@ -35,6 +36,7 @@ from matgl.layers import (
     SphericalBesselWithHarmonics,
     ThreeBodyInteractions,
     WeightedReadOut,
+    weight_three_body_basis,
 )
 from matgl.utils.cutoff import polynomial_cutoff
 from matgl.utils.io import IOMixIn
@@ -76,6 +78,8 @@ class M3GNet(nn.Module, IOMixIn):
         field: Literal["node_feat", "edge_feat"] = "node_feat",
         include_state: bool = False,
         activation_type: Literal["swish", "tanh", "sigmoid", "softplus2", "softexp"] = "swish",
+        share_weights: bool = False,
+        inference_dtype: torch.dtype | None = None,
         **kwargs,
     ):
         """
@@ -104,6 +108,9 @@ class M3GNet(nn.Module, IOMixIn):
             nlayers_set2set (int): Number of set2set layers
             include_state (bool): Whether to include states features
             activation_type (str): Activation type. choose from 'swish', 'tanh', 'sigmoid', 'softplus2', 'softexp'
+            share_weights (bool): Whether all blocks share the same three-body interaction and graph layer weights
+            inference_dtype (torch.dtype): Reduced precision dtype, e.g. torch.bfloat16, used for the basis expansions
+                and the interaction blocks in eval mode. Defaults to None, i.e. full precision.
             **kwargs: For future flexibility. Not used at the moment.
         """
         super().__init__()
@@ -144,36 +151,36 @@ class M3GNet(nn.Module, IOMixIn):
             use_phi=use_phi,
             use_smooth=use_smooth,
         )
-        self.three_body_interactions = nn.ModuleList(
-            {
-                ThreeBodyInteractions(
-                    update_network_atom=MLP(
-                        dims=[dim_node_embedding, degree],
-                        activation=nn.Sigmoid(),
-                        activate_last=True,
-                    ),
-                    update_network_bond=GatedMLP(in_feats=degree, dims=[dim_edge_embedding], use_bias=False),
-                )
-                for _ in range(nblocks)
-            }
-        )
+        # With shared weights, every block refers to the same module instance.
+        nmodules = 1 if share_weights else nblocks
+        three_body_interactions = [
+            ThreeBodyInteractions(
+                update_network_atom=MLP(
+                    dims=[dim_node_embedding, degree],
+                    activation=nn.Sigmoid(),
+                    activate_last=True,
+                ),
+                update_network_bond=GatedMLP(in_feats=degree, dims=[dim_edge_embedding], use_bias=False),
+            )
+            for _ in range(nmodules)
+        ]
+        self.three_body_interactions = nn.ModuleList(three_body_interactions * (nblocks // nmodules))
 
         dim_state_feats = dim_state_embedding
 
-        self.graph_layers = nn.ModuleList(
-            {
-                M3GNetBlock(
-                    degree=degree_rbf,
-                    activation=activation,
-                    conv_hiddens=[units, units],
-                    dim_node_feats=dim_node_embedding,
-                    dim_edge_feats=dim_edge_embedding,
-                    dim_state_feats=dim_state_feats,
-                    include_state=include_state,
-                )
-                for _ in range(nblocks)
-            }
-        )
+        graph_layers = [
+            M3GNetBlock(
+                degree=degree_rbf,
+                activation=activation,
+                conv_hiddens=[units, units],
+                dim_node_feats=dim_node_embedding,
+                dim_edge_feats=dim_edge_embedding,
+                dim_state_feats=dim_state_feats,
+                include_state=include_state,
+            )
+            for _ in range(nmodules)
+        ]
+        self.graph_layers = nn.ModuleList(graph_layers * (nblocks // nmodules))
         if is_intensive:
             input_feats = dim_node_embedding if field == "node_feat" else dim_edge_embedding
             if readout_type == "set2set":
@@ -206,6 +213,11 @@ class M3GNet(nn.Module, IOMixIn):
         self.include_states = include_state
         self.task_type = task_type
         self.is_intensive = is_intensive
+        self.ntargets = ntargets
+        self.inference_dtype = inference_dtype
+        # Source atoms of the bonds within threebody_cutoff and the topology of the line graph built from them, i.e.,
+        # its src and dst ids and n_triple_ij. No geometry is kept, so the cache holds no autograd history.
+        self._line_graph_cache: tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor] | None = None
 
     def forward(
         self,
@@ -227,37 +239,28 @@ class M3GNet(nn.Module, IOMixIn):
         bond_vec, bond_dist = compute_pair_vector_and_distance(g)
         g.edata["bond_vec"] = bond_vec
         g.edata["bond_dist"] = bond_dist
+        # The three-body cutoff envelope only depends on the bond distances, so it is stored with them.
+        g.edata["three_body_cutoff"] = polynomial_cutoff(bond_dist, self.threebody_cutoff)
 
         expanded_dists = self.bond_expansion(g.edata["bond_dist"])
-        if l_g is None:
-            l_g = create_line_graph(g, self.threebody_cutoff)
-        else:
-            valid_three_body = g.edata["bond_dist"] <= self.threebody_cutoff
-            if l_g.num_nodes() == g.edata["bond_vec"][valid_three_body].shape[0]:
-                l_g.ndata["bond_vec"] = g.edata["bond_vec"][valid_three_body]
-                l_g.ndata["bond_dist"] = g.edata["bond_dist"][valid_three_body]
-                l_g.ndata["pbc_offset"] = g.edata["pbc_offset"][valid_three_body]
-            else:
-                three_body_id = torch.concatenate(l_g.edges())
-                max_three_body_id = torch.max(three_body_id) + 1 if three_body_id.numel() > 0 else 0
-                l_g.ndata["bond_vec"] = g.edata["bond_vec"][:max_three_body_id]
-                l_g.ndata["bond_dist"] = g.edata["bond_dist"][:max_three_body_id]
-                l_g.ndata["pbc_offset"] = g.edata["pbc_offset"][:max_three_body_id]
-        l_g.apply_edges(compute_theta_and_phi)
+        l_g = self._get_line_graph(g, l_g)
         g.edata["rbf"] = expanded_dists
-        three_body_basis = self.basis_expansion(l_g)
-        three_body_cutoff = polynomial_cutoff(g.edata["bond_dist"], self.threebody_cutoff)
-        node_feat, edge_feat, state_feat = self.embedding(node_types, g.edata["rbf"], state_attr)
-        for i in range(self.n_blocks):
-            edge_feat = self.three_body_interactions[i](
-                g,
-                l_g,
-                three_body_basis,
-                three_body_cutoff,
-                node_feat,
-                edge_feat,
+        three_body_basis = self._prepare_three_body(l_g, g.edata["three_body_cutoff"])
+        reduced_precision = not self.training and self.inference_dtype is not None
+        if reduced_precision:
+            g.edata["rbf"] = g.edata["rbf"].to(self.inference_dtype)
+            three_body_basis = three_body_basis.to(self.inference_dtype)
+        with (
+            torch.autocast(g.device.type, dtype=self.inference_dtype) if reduced_precision else contextlib.nullcontext()
+        ):
+            node_feat, edge_feat, state_feat = self.embedding(node_types, g.edata["rbf"], state_attr)
+            edge_feat, node_feat, state_feat = self._run_blocks(
+                g, l_g, three_body_basis, node_feat, edge_feat, state_feat
             )
-            edge_feat, node_feat, state_feat = self.graph_layers[i](g, edge_feat, node_feat, state_feat)
+        if reduced_precision:
+            # The readout runs in full precision.
+            node_feat, edge_feat = node_feat.float(), edge_feat.float()
+            state_feat = state_feat.float() if state_feat is not None else None
         g.ndata["node_feat"] = node_feat
         g.edata["edge_feat"] = edge_feat
         if self.is_intensive:
@@ -269,7 +272,94 @@ class M3GNet(nn.Module, IOMixIn):
         else:
             g.ndata["atomic_properties"] = self.final_layer(g)
             output = dgl.readout_nodes(g, "atomic_properties", op="sum")
-        return torch.squeeze(output)
+        # Only the target dimension is dropped, so a batch of one graph still gives a 1D output.
+        return output.squeeze(-1) if self.ntargets == 1 else output
+
+    def _get_line_graph(self, g: dgl.DGLGraph, l_g: dgl.DGLGraph | None) -> dgl.DGLGraph:
+        """Build the line graph of g, or refresh the bond data of a given one, for the bonds within threebody_cutoff.
+
+        Args:
+            g: DGLGraph for a batch of graphs.
+            l_g: DGLGraph for a batch of line graphs, or None to build it from g.
+
+        Returns:
+            l_g: DGLGraph for a batch of line graphs.
+        """
+        # Indices of the bonds within the three-body cutoff, gathered once for all line graph node data.
+        three_body_id = torch.nonzero(g.edata["bond_dist"] <= self.threebody_cutoff, as_tuple=True)[0]
+        if l_g is None and self.training:
+            l_g = create_line_graph(g, self.threebody_cutoff)
+        elif l_g is None:
+            # The line graph topology only depends on how the three-body bonds are grouped by source atom, so it
+            # is reused while that grouping is unchanged, e.g. when the same structure is evaluated repeatedly.
+            three_body_src = g.edges()[0][three_body_id]
+            cache = self._line_graph_cache
+            if cache is not None and cache[0].device == three_body_src.device and torch.equal(cache[0], three_body_src):
+                _, src_id, dst_id, n_triple_ij = cache
+                l_g = dgl.graph((src_id, dst_id), num_nodes=n_triple_ij.numel())
+                l_g.ndata["n_triple_ij"] = n_triple_ij
+                three_body_id = three_body_id[: l_g.num_nodes()]
+                l_g.ndata["bond_vec"] = g.edata["bond_vec"][three_body_id]
+                l_g.ndata["bond_dist"] = g.edata["bond_dist"][three_body_id]
+                l_g.ndata["pbc_offset"] = g.edata["pbc_offset"][three_body_id]
+            else:
+                l_g = create_line_graph(g, self.threebody_cutoff)
+                self._line_graph_cache = (three_body_src, *l_g.edges(), l_g.ndata["n_triple_ij"])
+        else:
+            if l_g.num_nodes() == three_body_id.numel():
+                l_g.ndata["bond_vec"] = g.edata["bond_vec"][three_body_id]
+                l_g.ndata["bond_dist"] = g.edata["bond_dist"][three_body_id]
+                l_g.ndata["pbc_offset"] = g.edata["pbc_offset"][three_body_id]
+            else:
+                # Node data must cover every line graph node, so the number of bonds taking part in three-body
+                # interactions is the node count DGL already tracks.
+                max_three_body_id = l_g.num_nodes()
+                l_g.ndata["bond_vec"] = g.edata["bond_vec"][:max_three_body_id]
+                l_g.ndata["bond_dist"] = g.edata["bond_dist"][:max_three_body_id]
+                l_g.ndata["pbc_offset"] = g.edata["pbc_offset"][:max_three_body_id]
+        return l_g
+
+    def _prepare_three_body(self, l_g: dgl.DGLGraph, three_body_cutoff: torch.Tensor) -> torch.Tensor:
+        """Compute the bond angles and the three-body basis on the line graph.
+
+        The basis is weighted by the cutoff function of both bonds of each triple here, since these weights are the
+        same for every interaction block.
+
+        Args:
+            l_g: DGLGraph for a batch of line graphs.
+            three_body_cutoff: Three-body cutoff function values of the bonds.
+
+        Returns:
+            three_body_basis
+        """
+        l_g.apply_edges(compute_theta_and_phi)
+        return weight_three_body_basis(l_g, self.basis_expansion(l_g), three_body_cutoff)
+
+    def _run_blocks(
+        self,
+        g: dgl.DGLGraph,
+        l_g: dgl.DGLGraph,
+        three_body_basis: torch.Tensor,
+        node_feat: torch.Tensor,
+        edge_feat: torch.Tensor,
+        state_feat: torch.Tensor | None,
+    ) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor | None]:
+        """Apply all blocks, each a three-body interaction followed by a graph convolution.
+
+        Returns:
+            edge_feat, node_feat, state_feat
+        """
+        for three_body_interaction, graph_layer in zip(self.three_body_interactions, self.graph_layers):
+            edge_feat = three_body_interaction(
+                g,
+                l_g,
+                three_body_basis,
+                None,
+                node_feat,
+                edge_feat,
+            )
+            edge_feat, node_feat, state_feat = graph_layer(g, edge_feat, node_feat, state_feat)
+        return edge_feat, node_feat, state_feat
 
     def predict_structure(
         self,
@@ -294,4 +384,5 @@ class M3GNet(nn.Module, IOMixIn):
         g, state_feats_default = graph_converter.get_graph(structure)
         if state_feats is None:
             state_feats = torch.tensor(state_feats_default)
-        return self(g=g, state_attr=state_feats).detach()
+        with torch.inference_mode():
+            return self(g=g, state_attr=state_feats)
@@ -217,6 +217,7 @@ class MEGNet(nn.Module, IOMixIn):
         g, state_feats_default = graph_converter.get_graph(structure)
         if state_feats is None:
             state_feats = torch.tensor(state_feats_default)
-        bond_vec, bond_dist = compute_pair_vector_and_distance(g)
-        g.edata["edge_attr"] = self.bond_expansion(bond_dist)
-        return self(g, g.edata["edge_attr"], g.ndata["node_type"], state_feats).detach()
+        with torch.inference_mode():
+            bond_vec, bond_dist = compute_pair_vector_and_distance(g)
+            g.edata["edge_attr"] = self.bond_expansion(bond_dist)
+            return self(g, g.edata["edge_attr"], g.ndata["node_type"], state_feats)
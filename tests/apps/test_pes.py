@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import dgl
 import pytest
 import torch
 from pymatgen.core import Lattice, Structure
@@ -23,6 +24,7 @@ class TestPotential:
         assert [f.size(dim=0), f.size(dim=1)] == [2, 3]
         assert [s.size(dim=0), s.size(dim=1)] == [3, 3]
         assert [h.size(dim=0), h.size(dim=1)] == [6, 6]
+        assert torch.equal(h, h.T)
 
     def test_potential_efs(self, graph_MoS, model):
         structure, graph, state = graph_MoS
@@ -32,6 +34,33 @@ class TestPotential:
         assert [f.size(dim=0), f.size(dim=1)] == [2, 3]
         assert [s.size(dim=0), s.size(dim=1)] == [3, 3]
         assert [h.size(dim=0)] == [1]
+        assert {"data_mean", "data_std"} <= set(dict(ff.named_buffers()))
+
+    def test_potential_efs_batched(self, MoS, model):
+        structures = [MoS, Structure(Lattice.cubic(3.5), ["Mo", "S"], [[0.0, 0.0, 0.0], [0.45, 0.5, 0.55]])]
+        p2g = Structure2Graph(element_types=["Mo", "S"], cutoff=5.0)
+        ff = Potential(model=model)
+        stresses = [ff(p2g.get_graph(s)[0], torch.zeros(2))[2] for s in structures]
+        graph = dgl.batch([p2g.get_graph(s)[0] for s in structures])
+        e, f, s, h = ff(graph, torch.zeros(2, 2))
+        assert [torch.numel(e)] == [2]
+        assert [s.size(dim=0), s.size(dim=1)] == [6, 3]
+        torch.testing.assert_close(s, torch.cat(stresses))
+
+    def test_potential_create_graph(self, graph_MoS, model):
+        structure, graph, state = graph_MoS
+        ff = Potential(model=model)
+        e, f, s, h = ff(graph, state)
+        assert f.requires_grad
+        e, f, s, h = ff.eval()(graph, state)
+        assert not f.requires_grad
+
+    def test_potential_hessian_eval(self, graph_MoS, model):
+        structure, graph, state = graph_MoS
+        ff = Potential(model=model, calc_hessian=True)
+        _, _, _, h = ff(graph, state)
+        _, _, _, h_eval = ff.eval()(graph, state)
+        torch.testing.assert_close(h_eval, h)
 
     def test_potential_ef(self, graph_MoS, model):
         structure, graph, state = graph_MoS
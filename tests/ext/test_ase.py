@@ -4,11 +4,12 @@ import os.path
 
 import numpy as np
 import pytest
-from ase.build import molecule
+from ase.build import bulk, molecule
+from ase.calculators.emt import EMT
 from pymatgen.io.ase import AseAtomsAdaptor
 
 from matgl import load_model
-from matgl.ext.ase import Atoms2Graph, M3GNetCalculator, MolecularDynamics, Relaxer
+from matgl.ext.ase import Atoms2Graph, M3GNetCalculator, MolecularDynamics, Relaxer, TrajectoryObserver
 
 
 def test_M3GNetCalculator(MoS):
@@ -16,13 +17,16 @@ def test_M3GNetCalculator(MoS):
     s_ase = adaptor.get_atoms(MoS)  # type: ignore
     ff = load_model("M3GNet-MP-2021.2.8-PES")
     ff.calc_hessian = True
+    ff.train()
     calc = M3GNetCalculator(potential=ff)
     s_ase.set_calculator(calc)
     assert [s_ase.get_potential_energy().size] == [1]
+    # The calculator leaves the mode of the potential it was given unchanged.
+    assert ff.training
     assert list(s_ase.get_forces().shape) == [2, 3]
     assert list(s_ase.get_stress().shape) == [6]
     assert list(calc.results["hessian"].shape) == [6, 6]
-    np.testing.assert_allclose(s_ase.get_potential_energy(), -10.312888)
+    np.testing.assert_allclose(s_ase.get_potential_energy(), -10.312888, rtol=1e-6)
 
 
 def test_M3GNetCalculator_mol(AcAla3NHMe):
@@ -36,6 +40,24 @@ def test_M3GNetCalculator_mol(AcAla3NHMe):
     np.testing.assert_allclose(mol.get_potential_energy(), -242.77213)
 
 
+def test_M3GNetCalculator_skin(LiFePO4):
+    adaptor = AseAtomsAdaptor()
+    ff = load_model("M3GNet-MP-2021.2.8-PES")
+    s_ase = adaptor.get_atoms(LiFePO4)
+    s_ase.set_calculator(M3GNetCalculator(potential=ff))
+    s_ase_skin = adaptor.get_atoms(LiFePO4)
+    calc = M3GNetCalculator(potential=ff, skin=1.0)
+    s_ase_skin.set_calculator(calc)
+    rng = np.random.default_rng(42)
+    for _ in range(3):
+        displacement = rng.normal(scale=0.1, size=(len(s_ase), 3))
+        s_ase.positions += displacement
+        s_ase_skin.positions += displacement
+        np.testing.assert_allclose(s_ase_skin.get_potential_energy(), s_ase.get_potential_energy(), rtol=1e-6)
+        np.testing.assert_allclose(s_ase_skin.get_forces(), s_ase.get_forces(), atol=1e-4)
+    assert calc._neighbor_cache is not None
+
+
 def test_Relaxer(MoS):
     pot = load_model("M3GNet-MP-2021.2.8-PES")
     r = Relaxer(pot)
@@ -46,10 +68,26 @@ def test_Relaxer(MoS):
     assert traj["energies"].iloc[-1] < traj["energies"].iloc[0]
     for t in results["trajectory"]:
         assert len(t) == 5
+    results_skin = Relaxer(pot, skin=1.0).relax(MoS)
+    assert results_skin["final_structure"].lattice.a == pytest.approx(s.lattice.a, abs=1e-3)
     assert os.path.exists("MoS_relax.traj")
     os.remove("MoS_relax.traj")
 
 
+def test_TrajectoryObserver():
+    atoms = bulk("Cu", cubic=True)
+    atoms.calc = EMT()
+    obs = TrajectoryObserver(atoms, max_steps=2)
+    for _ in range(3):
+        atoms.positions += 0.01
+        obs()
+    assert len(obs) == 3
+    assert obs.forces.shape == (3, 4, 3)
+    assert obs.stresses.shape == (3, 6)
+    np.testing.assert_allclose(obs.atom_positions[-1], atoms.positions)
+    assert len(obs.as_pandas()) == 3
+
+
 def test_get_graph_from_atoms(LiFePO4):
     adaptor = AseAtomsAdaptor()
     structure_ase = adaptor.get_atoms(LiFePO4)
@@ -81,6 +119,19 @@ def test_get_graph_from_atoms_mol():
     assert np.allclose(graph.num_edges(), 20)
     # check the state features
     assert np.allclose(state, [0.0, 0.0])
+    with pytest.raises(KeyError, match="not in element_types"):
+        Atoms2Graph(element_types=["H"], cutoff=4.0).get_graph(mol)
+
+
+def test_get_graphs_from_atoms(LiFePO4):
+    adaptor = AseAtomsAdaptor()
+    a2g = Atoms2Graph(element_types=["H", "C", "Li", "Fe", "P", "O"], cutoff=4.0)
+    atoms = [adaptor.get_atoms(LiFePO4), molecule("CH4")]
+    graph, state = a2g.get_graphs(atoms)
+    assert graph.batch_size == 2
+    assert graph.batch_num_nodes().tolist() == [len(a) for a in atoms]
+    assert graph.batch_num_edges().tolist() == [704, 20]
+    assert np.allclose(state, [[0.0, 0.0], [0.0, 0.0]])
 
 
 def test_molecular_dynamics(MoS):
@@ -92,5 +143,8 @@ def test_molecular_dynamics(MoS):
         md.set_atoms(MoS)
     md = MolecularDynamics(MoS, potential=pot, ensemble=ensemble, taut=None, taup=None, compressibility_au=10)
     md.run(10)
+    md = MolecularDynamics(MoS, potential=pot, skin=1.0)
+    assert md.atoms.calc.skin == 1.0
+    md.run(10)
     with pytest.raises(ValueError, match="Ensemble not supported"):
         MolecularDynamics(MoS, potential=pot, ensemble="notanensemble")
@@ -3,6 +3,7 @@ from __future__ import annotations
 import os
 
 import numpy as np
+import pytest
 from pymatgen.core import Lattice, Structure
 
 from matgl.ext.pymatgen import Structure2Graph, get_element_list
@@ -66,6 +67,8 @@ class TestPmg2Graph:
         assert np.allclose(graph.edata["lattice"][0], [[4.04, 0.0, 0.0], [0.0, 4.04, 0.0], [0.0, 0.0, 4.04]])
         # check the volume
         assert np.allclose(graph.ndata["volume"][0], [65.939264])
+        with pytest.raises(KeyError, match=r"\['Ba'\] are not in element_types"):
+            Structure2Graph(element_types=("Ti", "O"), cutoff=4.0).get_graph(structure_BaTiO3)
 
     def test_get_element_list(self):
         cscl = Structure.from_spacegroup("Pm-3m", Lattice.cubic(3), ["Cs", "Cl"], [[0, 0, 0], [0.5, 0.5, 0.5]])
@@ -17,43 +17,37 @@ from matgl.graph.compute import (
 
 def _loop_indices(bond_atom_indices, pair_dist, cutoff=4.0):
     bin_count = np.bincount(bond_atom_indices[:, 0], minlength=bond_atom_indices[-1, 0] + 1)
-    indices = []
-    start = 0
-    for bcont in bin_count:
-        for i in range(bcont):
-            for j in range(bcont):
-                if start + i == start + j:
-                    continue
-                if pair_dist[start + i] > cutoff or pair_dist[start + j] > cutoff:
-                    continue
-                indices.append([start + i, start + j])
-        start += bcont
-    return np.array(indices)
+    # enumerate all (i, j) bond pairs of each source atom at once, with i as the outer index
+    n_pairs = bin_count**2
+    segment = np.repeat(np.arange(len(bin_count)), n_pairs)
+    local = np.arange(n_pairs.sum()) - np.repeat(np.cumsum(n_pairs) - n_pairs, n_pairs)
+    start = (np.cumsum(bin_count) - bin_count)[segment]
+    i, j = local // bin_count[segment], local % bin_count[segment]
+    idx_i, idx_j = start + i, start + j
+    mask = (i != j) & (pair_dist[idx_i] <= cutoff) & (pair_dist[idx_j] <= cutoff)
+    return np.stack([idx_i, idx_j], axis=1)[mask]
 
 
 def _calculate_cos_loop(graph, threebody_cutoff=4.0):
     """
-    Calculate the cosine theta of triplets using loops
+    Calculate the cosine theta of triplets by enumerating bond pairs sharing a source atom
     Args:
         graph: List
-    Returns: a list of cosine theta values.
+    Returns: an array of cosine theta values.
     """
-    _, _, n_sites = torch.unique(graph.edges()[0], return_inverse=True, return_counts=True)
-    start_index = 0
-    cos = []
-    for n_site in n_sites:
-        for i in range(n_site):
-            for j in range(n_site):
-                if i == j:
-                    continue
-                vi = graph.edata["bond_vec"][i + start_index].numpy()
-                vj = graph.edata["bond_vec"][j + start_index].numpy()
-                di = np.linalg.norm(vi)
-                dj = np.linalg.norm(vj)
-                if (di <= threebody_cutoff) and (dj <= threebody_cutoff):
-                    cos.append(vi.dot(vj) / np.linalg.norm(vi) / np.linalg.norm(vj))
-        start_index += n_site
-    return cos
+    n_sites = torch.bincount(graph.edges()[0])
+    offsets = torch.cumsum(n_sites, dim=0) - n_sites
+    pairs = []
+    for start, n_site in zip(offsets.tolist(), n_sites.tolist()):
+        ij = torch.cartesian_prod(torch.arange(n_site), torch.arange(n_site)).view(-1, 2)
+        pairs.append(ij[ij[:, 0] != ij[:, 1]] + start)
+    idx_i, idx_j = torch.cat(pairs).T
+    bond_vec = graph.edata["bond_vec"].detach()
+    bond_dist = torch.linalg.norm(bond_vec, dim=1)
+    mask = (bond_dist[idx_i] <= threebody_cutoff) & (bond_dist[idx_j] <= threebody_cutoff)
+    idx_i, idx_j = idx_i[mask], idx_j[mask]
+    cos = (bond_vec[idx_i] * bond_vec[idx_j]).sum(dim=1) / (bond_dist[idx_i] * bond_dist[idx_j])
+    return cos.numpy()
 
 
 class TestCompute:
@@ -186,3 +180,14 @@ def test_line_graph_extensive():
     assert 2 * g1.number_of_edges() == g2.number_of_edges()
     assert 2 * lg1.number_of_nodes() == lg2.number_of_nodes()
     assert 2 * lg1.number_of_edges() == lg2.number_of_edges()
+
+    # nearest neighbor bonds lie exactly at the three-body cutoff, with images up to 2 cells away
+    supercell = structure.copy()
+    supercell.make_supercell([3, 2, 1])
+    g3, _ = converter.get_graph(supercell)
+    bond_vec, bond_dist = compute_pair_vector_and_distance(g3)
+    g3.edata["bond_dist"] = bond_dist
+    g3.edata["bond_vec"] = bond_vec
+    lg3 = create_line_graph(g3, 3.0)
+    assert 6 * lg1.number_of_nodes() == lg3.number_of_nodes()
+    assert 6 * lg1.number_of_edges() == lg3.number_of_edges()
@@ -3,6 +3,7 @@ from __future__ import annotations
 import numpy as np
 import pytest
 import torch
+from scipy.special import spherical_jn
 from torch.testing import assert_close
 
 from matgl.graph.compute import (
@@ -58,6 +59,21 @@ def test_sphericalbesselfunction():
     assert [rbf.size(dim=0), rbf.size(dim=1)] == [11, 3]
 
 
+def test_sphericalbesselfunction_values():
+    r = torch.linspace(1.0, 6.0, 11)
+    rbf_sb = SphericalBesselFunction(max_n=3, max_l=3, cutoff=5.0, smooth=False)
+    roots = rbf_sb.roots.numpy()
+    r_c = np.minimum(r.numpy(), 5.0)[:, None]
+    expected = np.concatenate(
+        [
+            spherical_jn(i, r_c * roots[i] / 5.0) * np.sqrt(2.0 / 5.0**3) / np.abs(spherical_jn(i + 1, roots[i]))
+            for i in range(3)
+        ],
+        axis=1,
+    )
+    assert np.allclose(rbf_sb(r).numpy(), expected, atol=1e-5)
+
+
 def test_sphericalbesselfunction_smooth():
     r = torch.linspace(1.0, 5.0, 11)
     rbf_sb = SphericalBesselFunction(max_n=3, max_l=3, cutoff=5.0, smooth=False)
@@ -9,7 +9,7 @@ from matgl.graph.compute import (
 )
 from matgl.layers import BondExpansion, EmbeddingBlock, SphericalBesselWithHarmonics
 from matgl.layers._core import MLP, GatedMLP
-from matgl.layers._three_body import ThreeBodyInteractions
+from matgl.layers._three_body import ThreeBodyInteractions, weight_three_body_basis
 from matgl.utils.cutoff import polynomial_cutoff
 
 
@@ -46,3 +46,6 @@ def test_three_body_interactions(graph_MoS):
     )
     edge_feat_updated = three_body_interactions(g1, l_g1, three_body_basis, three_body_cutoff, node_feat, edge_feat)
     assert [edge_feat_updated.size(dim=0), edge_feat_updated.size(dim=1)] == [28, 16]
+    weighted_basis = weight_three_body_basis(l_g1, three_body_basis, three_body_cutoff)
+    edge_feat_weighted = three_body_interactions(g1, l_g1, weighted_basis, None, node_feat, edge_feat)
+    torch.testing.assert_close(edge_feat_weighted, edge_feat_updated)
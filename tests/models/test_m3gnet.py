@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import copy
 import os
 
 import pytest
 import torch
 
+from matgl.apps.pes import Potential
 from matgl.models import M3GNet
 
 
@@ -21,6 +23,46 @@ class TestM3GNet:
         os.remove("model.json")
         os.remove("state.pt")
 
+    def test_model_line_graph_cache(self, graph_MoS):
+        structure, graph, state = graph_MoS
+        model = M3GNet(element_types=["Mo", "S"], is_intensive=False).eval()
+        output = model(g=graph)
+        cache = model._line_graph_cache
+        torch.testing.assert_close(model(g=graph), output)
+        assert model._line_graph_cache is cache
+        # Training rebuilds the line graph on every call.
+        model.train()
+        model._line_graph_cache = None
+        torch.testing.assert_close(model(g=graph), output)
+        assert model._line_graph_cache is None
+
+    def test_model_deepcopy(self, graph_MoS):
+        structure, graph, state = graph_MoS
+        potential = Potential(model=M3GNet(element_types=["Mo", "S"], is_intensive=False)).eval()
+        _, forces, _, _ = potential(graph, state)
+        _, forces_cached, _, _ = potential(graph, state)
+        torch.testing.assert_close(forces_cached, forces)
+        potential_copy = copy.deepcopy(potential)
+        torch.testing.assert_close(potential_copy(graph, state)[1], forces)
+
+    def test_model_share_weights(self, graph_MoS):
+        structure, graph, state = graph_MoS
+        model = M3GNet(element_types=["Mo", "S"], is_intensive=False)
+        shared = M3GNet(element_types=["Mo", "S"], is_intensive=False, share_weights=True)
+        assert shared.graph_layers[0] is shared.graph_layers[2]
+        assert shared.three_body_interactions[0] is shared.three_body_interactions[2]
+        assert sum(p.numel() for p in shared.parameters()) < sum(p.numel() for p in model.parameters())
+        assert torch.numel(shared(g=graph)) == 1
+
+    def test_model_inference_dtype(self, graph_MoS):
+        structure, graph, state = graph_MoS
+        model = M3GNet(element_types=["Mo", "S"], is_intensive=False).eval()
+        output = model(g=graph)
+        model.inference_dtype = torch.bfloat16
+        output_bf16 = model(g=graph)
+        assert output_bf16.dtype == torch.float32
+        torch.testing.assert_close(output_bf16, output, atol=1e-2, rtol=1e-2)
+
     def test_exceptions(self):
         with pytest.raises(ValueError, match="Invalid activation type"):
             _ = M3GNet(element_types=None, is_intensive=False, activation_type="whatever")
@@ -31,7 +73,29 @@ class TestM3GNet:
         structure, graph, state = graph_MoS
         model = M3GNet(element_types=["Mo", "S"], is_intensive=True)
         output = model(g=graph)
+        assert output.shape == (1,)
+        assert model.predict_structure(structure).is_inference()
+        model = M3GNet(element_types=["Mo", "S"], is_intensive=True, ntargets=2)
+        assert model(g=graph).shape == (1, 2)
+
+    def test_model_intensive_with_state(self, graph_MoS):
+        structure, graph, state = graph_MoS
+        model = M3GNet(
+            element_types=["Mo", "S"],
+            is_intensive=True,
+            include_state=True,
+            ntypes_state=2,
+            dim_state_embedding=16,
+        )
+        block_outputs = []
+        model.graph_layers[-1].register_forward_hook(lambda module, inputs, outputs: block_outputs.append(outputs))
+        final_inputs = []
+        model.final_layer.register_forward_hook(lambda module, inputs, outputs: final_inputs.append(inputs[0]))
+        output = model(g=graph, state_attr=torch.tensor([1]))
         assert torch.numel(output) == 1
+        assert len(final_inputs) == 1
+        vec = torch.hstack([model.readout(graph), block_outputs[0][2]])
+        torch.testing.assert_close(output, model.final_layer(vec).squeeze(-1))
 
     def test_model_intensive_with_classification(self, graph_MoS):
         structure, graph, state = graph_MoS